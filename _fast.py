@@ -0,0 +1,276 @@
+"""Optional compiled helpers for bulk scoring and simulation.
+
+Numba is not a requirement of the game. When it is installed the helpers
+here are compiled with `numba.njit` (cached to disk so the compile cost is
+only paid on the first run); otherwise they run as plain Python and give
+identical results.
+"""
+
+import random
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+    try:
+        # module-level so the CUDA simulator can swap `cuda` out of the
+        # kernel's globals; the kernel itself is still built lazily
+        from numba import cuda, int64, uint8, uint64
+        from numba.cuda.random import xoroshiro128p_next
+    except ImportError:
+        cuda = None
+except ImportError:  # numba is optional
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for `numba.njit` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def score_hand_nb(ranks):
+    """Score one hand given as a sequence of ranks, ignoring 0 (empty slot).
+
+    Uses the same closed form as `Hand`: at most one ace can count as 11,
+    and it does whenever that doesn't bust the hand.
+
+    Returns:
+        tuple: (score, is blackjack, is bust).
+    """
+    hard = 0
+    aces = 0
+    n = 0
+    for r in ranks:
+        if r == 0:
+            continue
+        hard += 10 if r > 9 else r
+        aces += r == 1
+        n += 1
+    score = hard + 10 if aces > 0 and hard <= 11 else hard
+    return score, n == 2 and score == 21, score > 21
+
+
+@njit(cache=True)
+def score_ranks(ranks, n):
+    """Score the first `n` ranks of a hand using blackjack rules.
+
+    A thin wrapper over `score_hand_nb` for preallocated buffers whose
+    trailing slots don't belong to the hand.
+
+    Args:
+        ranks: sequence (list or uint8 array) of card ranks, 1-13.
+        n: number of leading entries of `ranks` that belong to the hand.
+
+    Returns:
+        int: the best score for the hand.
+    """
+    return score_hand_nb(ranks[:n])[0]
+
+
+@njit(cache=True)
+def _score_rows(rows, out):
+    for i in range(len(rows)):
+        out[i] = score_hand_nb(rows[i])[0]
+
+
+def score_hands(rows):
+    """Score many hands at once.
+
+    Args:
+        rows: one row of ranks per hand, padded with 0 to a common length
+            (a 2-D uint8 array or a list of lists).
+
+    Returns:
+        list of int scores, one per row.
+    """
+    if not HAS_NUMBA:
+        out = [0] * len(rows)
+        _score_rows(rows, out)
+        return out
+
+    import numpy as np
+
+    rows = np.ascontiguousarray(rows, dtype=np.uint8)
+    out = np.empty(len(rows), dtype=np.int64)
+    _score_rows(rows, out)
+    return out.tolist()
+
+
+# Largest shoe the CUDA kernel keeps in per-thread local memory (8 decks).
+MAX_SHOE_SIZE = 52 * 8
+
+
+def _play_round(shoe, size, state, stand_on, dealer_stand):
+    """Play one player hand against the dealer from a shoe of ranks.
+
+    Cards are drawn with a partial Fisher-Yates shuffle over the live region
+    `shoe[:remaining]`, so the buffer always stays a permutation of the shoe
+    and can be reused for the next round without copying. Dealer naturals
+    are rejected and redealt like `Game.deal` does. Randomness comes from an
+    inline xorshift32 generator so the same code compiles for the CPU and as
+    a CUDA device function.
+
+    Args:
+        shoe: mutable sequence of ranks (1-13).
+        size: number of cards in the shoe.
+        state: non-zero 32-bit generator state.
+        stand_on: the player hits while their score is below this.
+        dealer_stand: the dealer hits while their score is below this.
+
+    Returns:
+        tuple: (net result in units of the bet, updated generator state).
+    """
+    remaining = size
+    p_hard = 0
+    p_aces = 0
+    p_n = 0
+    d_hard = 0
+    d_aces = 0
+    d_n = 0
+    while True:
+        p_score = p_hard + 10 if p_aces > 0 and p_hard <= 11 else p_hard
+        d_score = d_hard + 10 if d_aces > 0 and d_hard <= 11 else d_hard
+        if d_n < 2:
+            to_dealer = True
+        elif d_n == 2 and d_score == 21:
+            # dealer natural: put the two cards back and redeal them
+            remaining += 2
+            d_hard = 0
+            d_aces = 0
+            d_n = 0
+            continue
+        elif p_n < 2 or p_score < stand_on:
+            to_dealer = False
+        elif p_score <= 21 and d_score < dealer_stand:
+            to_dealer = True
+        else:
+            break
+
+        state ^= (state << 13) & 0xFFFFFFFF
+        state ^= state >> 17
+        state ^= (state << 5) & 0xFFFFFFFF
+        j = (state * remaining) >> 32
+        remaining -= 1
+        rank = shoe[j]
+        shoe[j] = shoe[remaining]
+        shoe[remaining] = rank
+
+        value = 10 if rank > 9 else rank
+        if to_dealer:
+            d_hard += value
+            d_aces += rank == 1
+            d_n += 1
+        else:
+            p_hard += value
+            p_aces += rank == 1
+            p_n += 1
+
+    if p_score > 21 or (d_score <= 21 and d_score > p_score):
+        return -1.0, state
+    if d_score == p_score:
+        return 0.0, state
+    if p_n == 2 and p_score == 21:
+        return 1.5, state
+    return 1.0, state
+
+
+play_round = njit(cache=True)(_play_round)
+
+
+@njit(cache=True)
+def simulate_rounds(shoe, n_rounds, state, stand_on, dealer_stand):
+    """Play `n_rounds` independent rounds on the CPU and return the net total."""
+    work = shoe.copy()
+    size = len(work)
+    total = 0.0
+    for _ in range(n_rounds):
+        result, state = play_round(work, size, state, stand_on, dealer_stand)
+        total += result
+    return total
+
+
+_cuda_kernel = None
+
+
+def _get_cuda_kernel():
+    """Compile (once) and return the CUDA kernel playing one round per thread."""
+    global _cuda_kernel
+    if _cuda_kernel is None:
+        play = cuda.jit(device=True)(_play_round)
+
+        @cuda.jit
+        def sim_kernel(rng_states, shoe, stand_on, dealer_stand, out):
+            i = cuda.grid(1)
+            if i >= out.shape[0]:
+                return
+            size = shoe.shape[0]
+            work = cuda.local.array(MAX_SHOE_SIZE, uint8)
+            for k in range(size):
+                work[k] = shoe[k]
+            # seed this thread's xorshift32 from the high half of the full
+            # 64-bit xoroshiro output (a float32 uniform only carries 24 bits,
+            # which would repeat streams after a few thousand threads)
+            state = int64(xoroshiro128p_next(rng_states, i) >> uint64(32))
+            if state == 0:
+                state = 1
+            result, _ = play(work, size, state, stand_on, dealer_stand)
+            out[i] = result
+
+        _cuda_kernel = sim_kernel
+    return _cuda_kernel
+
+
+def _cuda_available() -> bool:
+    """Return True when numba.cuda is importable and can see a GPU."""
+    if not HAS_NUMBA or cuda is None:
+        return False
+    try:
+        return cuda.is_available()
+    except Exception:
+        return False
+
+
+def simulate(ranks, n_rounds: int, seed=None, stand_on: int = 17, dealer_stand: int = 17) -> float:
+    """Estimate the expected net return per unit bet over `n_rounds` rounds.
+
+    Dispatches to the CUDA kernel when numba.cuda finds a GPU, to the
+    njit-compiled CPU loop when only numba is installed, and to plain
+    Python otherwise.
+
+    Args:
+        ranks: ranks (1-13) of every card in a full shoe.
+        n_rounds: number of independent rounds to play.
+        seed: optional seed for reproducible runs. The CUDA and CPU paths
+            derive per-round streams differently, so a seed only reproduces
+            a result on the same backend.
+        stand_on: the player hits while their score is below this.
+        dealer_stand: the dealer hits while their score is below this.
+
+    Returns:
+        float: mean net result per round, in units of the bet.
+    """
+    if n_rounds < 1:
+        raise ValueError("n_rounds must be >= 1")
+    if seed is None:
+        seed = random.randrange(2**32)
+    state = seed % 0xFFFFFFFF + 1
+
+    if not HAS_NUMBA:
+        return simulate_rounds(list(ranks), n_rounds, state, stand_on, dealer_stand) / n_rounds
+
+    import numpy as np
+
+    shoe = np.asarray(ranks, dtype=np.uint8)
+    if len(shoe) <= MAX_SHOE_SIZE and _cuda_available():
+        from numba.cuda.random import create_xoroshiro128p_states
+
+        threads = 256
+        blocks = (n_rounds + threads - 1) // threads
+        rng_states = create_xoroshiro128p_states(blocks * threads, seed=seed)
+        out = cuda.device_array(n_rounds, dtype=np.float32)
+        _get_cuda_kernel()[blocks, threads](rng_states, cuda.to_device(shoe), stand_on, dealer_stand, out)
+        return float(out.copy_to_host().sum(dtype=np.float64)) / n_rounds
+
+    return simulate_rounds(shoe, n_rounds, state, stand_on, dealer_stand) / n_rounds
@@ -1,11 +1,12 @@
-import random
-from typing import List, Optional
+from typing import Iterable, List, Optional
 import time
 import os
 import config
+from cards import Card, Deck
 
 # When TEST_MODE is True the code will avoid printing and sleeping which
-# makes automated tests quieter and faster. Tests can enable this by either
+# makes automated tests quieter and faster (it also skips clearing the
+# screen). Tests can enable this by either
 # passing `test_mode=True` to `Game(...)` or by setting
 # `Blackjack.TEST_MODE = True` before creating a Game instance.
 TEST_MODE = False
@@ -20,35 +21,26 @@ def _sleep(seconds: float):
     if not TEST_MODE:
         time.sleep(seconds)
 
-class Card:
-    suit: int
-    number: int
-    suits = ['S', 'H', 'C', 'D'] # suits
 
-    def __init__(self, suit, number):
-        self.suit = suit
-        self.number = number
+def _clear():
+    if TEST_MODE:
+        return
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # ANSI clear screen + cursor home, no need to spawn a shell
+        print("\033[2J\033[H", end="", flush=True)
+
+# blackjack value of each rank, indexed by card number (aces count as 1)
+_RANK_VAL = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+
+# amount paid back per unit bet, indexed by [hand status + 1][hand.blackjack]
+_PAYOUT = ((0.0, 0.0), (1.0, 1.0), (2.0, 2.5))
 
-    def __str__(self):
-        num = str(self.number)
-        
-        match self.number:
-            case 1:
-                num = 'A'
-            case 11:
-                num = 'J'
-            case 12:
-                num = 'Q'
-            case 13:
-                num = 'K'
-
-        suit = self.suits[self.suit]
-        return num+suit
-    
-    def __repr__(self):
-        return self.__str__()
-    
 class Hand:
+    # no per-hand __dict__, like Card
+    __slots__ = ('cards', 'score', 'hideDealerCards', 'bust', 'bet', 'status', 'blackjack', 'split', '_hard', '_aces')
+
     cards: List[Card]
     score: int
     hideDealerCards: bool
@@ -57,6 +49,8 @@ class Hand:
     status: int
     blackjack: bool
     split: bool
+    _hard: int # total with every ace counted as 1
+    _aces: int
 
     def __init__(self, cards: List[Card], bet: float, isDealer: bool = False) -> None:
         self.hideDealerCards = isDealer
@@ -71,38 +65,62 @@ class Hand:
 
     def addToHand(self, card: List[Card]) -> None:
         self.cards.extend(card)
-        self.updateScore()
+        for c in card:
+            self._hard += _RANK_VAL[c.number]
+            self._aces += c.number == 1
+        self._settleScore()
     
+    def addCard(self, card: Card) -> None:
+        # single-card version of addToHand, used for every hit
+        self.cards.append(card)
+        self._hard += _RANK_VAL[card.number]
+        self._aces += card.number == 1
+        self._settleScore()
+
     def popFromHand(self) -> Card:
         card = self.cards.pop()
-        self.updateScore()
+        self._hard -= _RANK_VAL[card.number]
+        self._aces -= card.number == 1
+        self._settleScore()
         return card
 
     def updateScore(self) -> None:
-        nonAces = []
-        aces = 0
+        # full recount, needed whenever self.cards is replaced directly;
+        # addToHand/popFromHand keep the running totals up to date
+        hard = aces = 0
         for c in self.cards:
-            if c.number == 1:
-                aces += 1
-            elif c.number > 9:
-                nonAces.append(10)
-            else:
-                nonAces.append(c.number)
-        score = sum(nonAces) + aces * 11
+            hard += _RANK_VAL[c.number]
+            aces += c.number == 1
+        self._hard = hard
+        self._aces = aces
+        self._settleScore()
 
-        while score > 21 and aces > 0:
-            score -= 10
-            aces -= 1
+    def _settleScore(self) -> None:
+        # at most one ace can ever count as 11, so add its extra 10 only
+        # when that doesn't bust the hand
+        score = self._hard + 10 if self._aces and self._hard <= 11 else self._hard
 
         self.score = score
+        self.bust = score > 21
+        self.blackjack = score == 21 and len(self.cards) == 2
+
+    @staticmethod
+    def score_many(ranks) -> List[int]:
+        """Score many hands at once, e.g. for simulations.
 
-        if self.score > 21:
-            self.bust = True
+        Args:
+            ranks: one row of card numbers per hand, padded with 0 to a common
+                length (a 2-D uint8 array or a list of lists).
+
+        Returns:
+            a list with the score of each row; the scoring runs compiled
+            when numba is installed (see `_fast.score_hands`).
+        """
+        import _fast  # imported lazily, pulls in numba when installed
 
-        if self.score == 21 and len(self.cards) == 2:
-            self.blackjack = True
+        return _fast.score_hands(ranks)
 
-    def finishHand(self, dealer: Hand):
+    def finishHand(self, dealer: "Hand"):
         if self.bust or (not dealer.bust and dealer.score > self.score):
             self.status = -1
         elif dealer.score == self.score:
@@ -125,36 +143,6 @@ class Hand:
     def __repr__(self) -> str:
         return self.__str__()
     
-class Deck:
-    deck: List[Card]
-
-    def __init__(self, num_decks: int = 1) -> None:
-        if num_decks < 1:
-            raise ValueError("num_decks must be >= 1")
-        numbers = [i + 1 for i in range(13)]  # numbers
-        # build `num_decks` worth of cards
-        self.deck = [Card(suit=s, number=n) for _ in range(num_decks) for n in numbers for s in range(4)]
-
-    def shuffleDeck(self):
-        random.shuffle(self.deck)
-
-    def draw(self, num: int) -> List[Card]:
-        ret = []
-        for _ in range(num):
-            ret.append(self.deck.pop())
-        return ret
-    
-    def returnToDeck(self, cards: List[Card]) -> int:
-        for c in cards:
-            self.deck.append(c)
-        return len(cards)
-    
-    def __str__(self) -> str:
-        return str(self.deck)
-    
-    def __repr__(self) -> str:
-        return self.__str__()
-    
 class Game:
     dealer: Hand
     hands: List[Hand]
@@ -163,8 +151,9 @@ class Game:
     minimum_buy: float
 
     num_hands: int
+    num_decks: int
 
-    def __init__(self, hands_to_play: int, total_money: float, minimum_buy: float = 50, starting_bets:List[float] = [], num_decks: int = config.DEFAULT_NUM_DECKS, test_mode: bool = False) -> None:
+    def __init__(self, hands_to_play: int, total_money: float, minimum_buy: float = 50, starting_bets:List[float] = [], num_decks: int = config.DEFAULT_NUM_DECKS, test_mode: bool = False, seed: Optional[int] = None) -> None:
         """Initialize a Game.
 
         Args:
@@ -174,14 +163,19 @@ class Game:
             starting_bets: optional list of starting bets.
             num_decks: how many 52-card decks to use in the shoe.
             test_mode: when True, suppress prints and sleeps (useful for tests).
+            seed: optional seed for the shoe's shuffles, for reproducible rounds.
         """
         # enable test mode for the module if requested
         if test_mode:
             global TEST_MODE
             TEST_MODE = True
 
+        # bound once so test games never reach time.sleep at all
+        self._sleep = (lambda seconds: None) if test_mode else _sleep
+
         self.num_hands = hands_to_play
-        self.deck = Deck(num_decks)
+        self.num_decks = num_decks
+        self.deck = Deck(num_decks, seed)
         self.total_money = total_money
         self.minimum_buy = minimum_buy
         self.hands = []
@@ -197,37 +191,44 @@ class Game:
 
 
     def hit(self, player_no: int):
-        if player_no == -1:
-            self.dealer.addToHand(self.deck.draw(1))
-        else:
-            self.hands[player_no].addToHand(self.deck.draw(1))
+        """Deal one card to hand `player_no`, or to the dealer when it is -1."""
+        self._deal_to(self.dealer if player_no == -1 else self.hands[player_no])
+
+    def _deal_to(self, hand: Hand):
+        hand.addCard(self.deck.drawCard())
 
     def deal(self):
-        valid = False
-        while not valid:
-            valid = True
-            for _ in range(2):
-                for h in self.hands:
-                    cards = self.deck.draw(1)
-                    h.addToHand(cards)
-
-            d_cards = self.deck.draw(2)
-            self.dealer.addToHand(d_cards)
-
-            if (self.dealer.score == 21):
-                _print("Dealer has 21, resetting: " + str(self.dealer))
-                self.resetDeck()
-                valid = False
+        # deal the dealer first so a natural only sends those two cards back
+        # to the shoe; the players haven't been dealt anything yet
+        self.dealer.addToHand(self.deck.draw(2))
+        while self.dealer.score == 21:
+            _print("Dealer has 21, resetting: " + str(self.dealer))
+            self.deck.returnToDeck(self.dealer.cards)
+            self.dealer.cards = []
+            self.dealer.updateScore()
+            self.deck.shuffleDeck()
+            self.dealer.addToHand(self.deck.draw(2))
+
+        # draw the players' cards at once and go round the hands twice
+        n = len(self.hands)
+        cards = self.deck.draw(2 * n)
+        for i, h in enumerate(self.hands):
+            h.addToHand([cards[i], cards[n + i]])
 
     def resetDeck(self):
         for h in self.hands:
             self.deck.returnToDeck(h.cards)
             h.cards = []
+            h.updateScore()
         self.deck.returnToDeck(self.dealer.cards)
         self.dealer.cards = []
+        self.dealer.updateScore()
         self.deck.shuffleDeck()
 
     def gameState(self, current_hand: Optional[int] = None, end_game: bool = False):
+        # nothing would be printed, so don't build the hand strings either
+        if TEST_MODE:
+            return
         _print("--------------------------------------")
         dealer_suffix = " <-- Dealer's turn" if current_hand is None and not end_game else ""
         _print("Dealer's Hand: " + str(self.dealer) + dealer_suffix)
@@ -259,7 +260,7 @@ class Game:
             return
         elif hand.split and hand.cards[0].number == 1:
             _print("Split Aces, drawing one card...")
-            self.hit(hand_i)
+            self._deal_to(hand)
             self.gameState()
             return
         _print(f"Playing hand #{hand_i + 1}... Please enter the number for action")
@@ -281,7 +282,7 @@ class Game:
         match user_input:
             case "1":
                 while user_input == "1":
-                    self.hit(hand_i)
+                    self._deal_to(hand)
                     self.gameState(current_hand=hand_i)
                     if hand.bust:
                         _print("Hand busted!")
@@ -298,7 +299,7 @@ class Game:
                 self.total_money -= hand.bet
                 # double down: match the current bet
                 hand.bet += hand.bet
-                self.hit(hand_i)
+                self._deal_to(hand)
                 self.gameState(current_hand=hand_i)
                 if hand.bust:
                     _print("Doubled and hand busted!")
@@ -311,12 +312,7 @@ class Game:
 
                 hand.split = True
                 new_hand.split = True
-                temp = []
-                for i, h in enumerate(self.hands):
-                    temp.append(h)
-                    if i == hand_i:
-                        temp.append(new_hand)
-                self.hands = temp
+                self.hands.insert(hand_i + 1, new_hand)
                 
                 self.gameState()
                 self.actionPrompt(hand_i)
@@ -335,10 +331,10 @@ class Game:
         """
         _print("Game Started!")
         self.deck.shuffleDeck()
-        _sleep(0.5)
+        self._sleep(0.5)
         _print("Dealing Cards...\n")
         self.deal()
-        _sleep(1)
+        self._sleep(1)
 
         # Player's turn
         self.play_players()
@@ -356,7 +352,7 @@ class Game:
             h = self.hands[i]
             self.gameState(current_hand=i)
             self.actionPrompt(i)
-            _sleep(0.5)
+            self._sleep(0.5)
             i += 1
 
     def play_dealer(self):
@@ -365,37 +361,56 @@ class Game:
         self.dealer.hideDealerCards = False
         _print("Dealer reveals hidden card!")
         self.gameState()
-        _sleep(1)
-        while self.dealer.score < 17:
+        self._sleep(1)
+        while self.dealer.score < config.DEALER_STAND_THRESHOLD:
             _print("Dealer Draws...")
-            _sleep(2)
-            self.hit(-1)
+            self._sleep(2)
+            self._deal_to(self.dealer)
             self.gameState()
 
-            if (self.dealer.score > 17):
-                _sleep(2)
+            if (self.dealer.score > config.DEALER_STAND_THRESHOLD):
+                self._sleep(2)
 
         # Finalize results and adjust bankroll
         for h in self.hands:
             h.finishHand(self.dealer)
-            if h.checkHand() == 0:
-                self.total_money += h.bet
-            elif h.checkHand() == 1:
-                if h.blackjack:
-                    self.total_money += h.bet * 2.5
-                else:
-                    self.total_money += h.bet * 2
+        self.total_money += sum(h.bet * _PAYOUT[h.checkHand() + 1][h.blackjack] for h in self.hands)
+
+    def simulate(self, n: int, seed: Optional[int] = None, stand_on: int = config.DEALER_STAND_THRESHOLD) -> float:
+        """Estimate the expected return per unit bet over `n` simulated rounds.
+
+        Each round is played headless from a freshly shuffled shoe of this
+        game's size, with the player hitting while below `stand_on`. The
+        game's own deck, hands and bankroll are left untouched. Runs on the
+        GPU through numba.cuda when available (see `_fast.simulate`).
 
-def waitForInput(message: str, validResponses: List[str]):
+        Args:
+            n: number of independent rounds to simulate.
+            seed: optional seed for reproducible estimates; a seed only
+                reproduces a result on the same backend (GPU or CPU).
+            stand_on: player score at which the simulated player stands.
+
+        Returns:
+            float: mean net result per round, in units of the bet.
+        """
+        import _fast  # imported lazily, pulls in numba when installed
+
+        ranks = [c.number for c in Deck(self.num_decks).deck]
+        return _fast.simulate(ranks, n, seed, stand_on, config.DEALER_STAND_THRESHOLD)
+
+def waitForInput(message: str, validResponses: Iterable[str]):
+    # hash lookups instead of scanning the list on every attempt
+    valid = validResponses if isinstance(validResponses, (set, frozenset)) else frozenset(validResponses)
     user_input = input(message)
-    while user_input not in validResponses:
+    while user_input not in valid:
         _print("\nPlease enter a valid choice.")
         user_input = input(message)
     _print("\n")
     return user_input
     
-if __name__ == "__main__":
-    os.system('cls' if os.name == 'nt' else 'clear')
+def main():
+    """Run the interactive console game until the player exits."""
+    _clear()
     _print('\n')
     _print("How much do you want to buy in?")
     buy_in = float(input())
@@ -422,4 +437,8 @@ if __name__ == "__main__":
         if user_input == "1":
             play = True
             buy_in = game.total_money
-            os.system('cls' if os.name == 'nt' else 'clear')
\ No newline at end of file
+            _clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,79 +1,156 @@
 import random
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from itertools import product
 
 
+# display form of each rank, indexed by card number, and of each suit,
+# indexed by suit
+RANK_CHAR = ("", "A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+SUIT_CHAR = "SHCD"
+
+
 class Card:
     """Represent a single playing card.
 
-    The card stores a suit index which maps into `Card.suits` and a number
-    in the range 1..13 where 1=Ace and 11..13 are face cards.
+    The card stores a suit index which maps into `SUIT_CHAR` and a number
+    in the range 1..13 where 1=Ace and 11..13 are face cards. Instances use
+    `__slots__` so a multi-deck shoe doesn't carry a `__dict__` per card.
+
+    Each card also carries a packed integer `code` (`suit << 4 | number`)
+    which is what equality, hashing and ordering compare.
     """
 
+    __slots__ = ("suit", "number", "code", "_s")
+
     suit: int
     number: int
-    suits = ["S", "H", "C", "D"]  # suits
+    code: int
+    suits = SUIT_CHAR  # alias kept for existing callers
+    _pool: Dict[Tuple[int, int], "Card"] = {}  # interned instances, see __new__
+
+    def __new__(cls, suit, number):
+        """Return the Card for (`suit`, `number`), creating it on first use.
 
-    def __init__(self, suit, number):
-        """Initialize a Card.
+        Cards are immutable and interned: every `Card(suit, number)` call
+        with the same arguments returns the same instance, so a shoe holds
+        references to at most 52 objects however many decks it contains.
 
         Args:
-            suit: integer index into Card.suits.
+            suit: integer index into SUIT_CHAR.
             number: rank of the card (1-13).
         """
-        self.suit = suit
-        self.number = number
+        card = cls._pool.get((suit, number))
+        if card is None:
+            card = super().__new__(cls)
+            object.__setattr__(card, "suit", suit)
+            object.__setattr__(card, "number", number)
+            object.__setattr__(card, "code", suit << 4 | number)
+            object.__setattr__(card, "_s", None)  # rendered form, see __str__
+            cls._pool[(suit, number)] = card
+        return card
+
+    @classmethod
+    def get(cls, suit, number) -> "Card":
+        """Return the shared Card for (`suit`, `number`); same as `Card(...)`."""
+        return cls(suit, number)
+
+    def __setattr__(self, name, value):
+        """Reject attribute writes; cards are shared and must not change."""
+        raise AttributeError("Card objects are immutable")
+
+    def __reduce__(self):
+        """Pickle/copy as a constructor call so the interned card is reused."""
+        return (Card, (self.suit, self.number))
 
     def __str__(self):
-        """Return a short representation like 'AS', '10D' or 'KH'."""
-        num = str(self.number)
-
-        match self.number:
-            case 1:
-                num = "A"
-            case 11:
-                num = "J"
-            case 12:
-                num = "Q"
-            case 13:
-                num = "K"
-
-        suit = self.suits[self.suit]
-        return num + suit
+        """Return a short representation like 'AS', '10D' or 'KH'.
+
+        The string is built on first use and cached on the card, since a
+        card's suit and number never change.
+        """
+        if self._s is not None:
+            return self._s
+
+        s = RANK_CHAR[self.number] + SUIT_CHAR[self.suit]
+        object.__setattr__(self, "_s", s)
+        return s
 
     def __repr__(self):
         """Return same as __str__ for debugging contexts."""
         return self.__str__()
 
+    def __eq__(self, other):
+        """Cards are equal when they have the same suit and number."""
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.code == other.code
+
+    def __hash__(self):
+        """Hash by the packed code so equal cards hash alike."""
+        return self.code
+
+    def __lt__(self, other):
+        """Order cards by packed code: suit first, then number."""
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.code < other.code
+
 
 class Deck:
     """A shoe containing one or more standard 52-card decks.
 
-    Provides basic operations like shuffle, draw and returnToDeck.
+    Provides basic operations like shuffle, draw and returnToDeck. The top
+    of the shoe is the end of `deck`, so drawing and returning cards only
+    ever touch that end of the list and never shift the rest of it.
     """
 
     deck: List[Card]
+    _rng: random.Random = random.Random()  # shared by unseeded decks, see Deck.seed
+
+    # one shared instance of every card, in suit-major order; uses
+    # `SUIT_CHAR` to determine the number of suits instead of hardcoding 4
+    _PROTOTYPE: Tuple[Card, ...] = tuple(
+        Card.get(s, n) for s, n in product(range(len(SUIT_CHAR)), range(1, 14))
+    )
+    _templates: Dict[int, List[Card]] = {}  # unshuffled shoe per num_decks
 
-    def __init__(self, num_decks: int = 1) -> None:
+    def __init__(self, num_decks: int = 1, seed: Optional[int] = None) -> None:
         """Create `num_decks` deck(s) of cards.
 
-        Uses `Card.suits` to determine the number of suits instead of hardcoding 4.
+        The shoe is built by repeating the shared 52-card `Deck._PROTOTYPE`
+        (cached per `num_decks`), so no Card objects are created and no
+        Python-level loop runs per card.
+
+        Args:
+            num_decks: how many 52-card decks to put in the shoe.
+            seed: optional seed for this deck's shuffles, for reproducible
+                games and tests. Without one the deck shuffles with the
+                generator shared by all unseeded decks.
         """
         if num_decks < 1:
             raise ValueError("num_decks must be >= 1")
 
-        suits = range(len(Card.suits))
-        numbers = range(1, 14)
-        # iterate over decks so multiple decks are grouped together
-        self.deck = [
-            Card(suit=s, number=n)
-            for _ in range(num_decks)
-            for s, n in product(suits, numbers)
-        ]
+        # whole decks are grouped together; each shoe size is built once and
+        # later decks of that size start from a plain copy of it
+        template = Deck._templates.get(num_decks)
+        if template is None:
+            template = Deck._templates[num_decks] = list(Deck._PROTOTYPE) * num_decks
+        self.deck = template.copy()
+        if seed is not None:
+            self._rng = random.Random(seed)
+
+    @classmethod
+    def seed(cls, seed: Optional[int] = None) -> None:
+        """Reseed the generator shared by decks created without a seed."""
+        cls._rng.seed(seed)
 
-    def shuffleDeck(self):
-        """Shuffle the deck of cards in place."""
-        random.shuffle(self.deck)
+    def shuffleDeck(self, rng: Optional[random.Random] = None):
+        """Shuffle the deck of cards in place.
+
+        Args:
+            rng: optional generator to shuffle with instead of the deck's own.
+        """
+        (rng or self._rng).shuffle(self.deck)
 
     def draw(self, num: int) -> List[Card]:
         """Draw `num` cards from the deck and return them.
@@ -83,12 +160,31 @@ class Deck:
 
         Returns:
             List[Card]: list of drawn Card objects (last-in-first-out order).
+
+        Raises:
+            IndexError: if fewer than `num` cards remain; the deck is left
+                untouched.
         """
-        ret = []
-        for _ in range(num):
-            ret.append(self.deck.pop())
+        if num > len(self.deck):
+            raise IndexError("draw from a deck with too few cards")
+        if num <= 0:
+            return []
+        # take the cards off the end in one reversed slice (top card first)
+        # instead of popping each one
+        ret = self.deck[-1:-num - 1:-1]
+        del self.deck[-num:]
         return ret
 
+    def drawCard(self) -> Card:
+        """Draw the top card of the deck.
+
+        Like `draw(1)` but returns the Card itself rather than a list.
+
+        Raises:
+            IndexError: if the deck is empty.
+        """
+        return self.deck.pop()
+
     def returnToDeck(self, cards: List[Card]) -> int:
         """Return the provided cards to the deck (appended to the end).
 
@@ -98,10 +194,13 @@ class Deck:
         Returns:
             int: number of cards returned.
         """
-        for c in cards:
-            self.deck.append(c)
+        self.deck.extend(cards)
         return len(cards)
 
+    def __len__(self) -> int:
+        """Return the number of cards left in the shoe."""
+        return len(self.deck)
+
     def __str__(self) -> str:
         """Return a compact string form of the deck (for debugging)."""
         return str(self.deck)
@@ -8,8 +8,10 @@ These tests avoid any interactive prompts and exercise pure logic only.
 """
 
 import unittest
+from unittest import mock
 import config
-from blackjack import Card, Hand, Game
+import blackjack
+from blackjack import Card, Hand, Game, waitForInput
 class TestDeckAndHand(unittest.TestCase):
     def test_hand_aces_and_blackjack(self):
         # Ace + 9 should count the ace as 11 to make 20
@@ -20,6 +22,15 @@ class TestDeckAndHand(unittest.TestCase):
         h2 = Hand([Card(0, 1), Card(1, 13)], 10)
         self.assertTrue(h2.blackjack)
 
+    def test_blackjack_only_for_two_card_ace_and_ten(self):
+        # every ace + ten-value pair, in either order, is a blackjack
+        for n in (10, 11, 12, 13):
+            self.assertTrue(Hand([Card(0, 1), Card(1, n)], 10).blackjack)
+            self.assertTrue(Hand([Card(1, n), Card(0, 1)], 10).blackjack)
+        # 21 made with three cards is not
+        self.assertFalse(Hand([Card(0, 1), Card(1, 5), Card(2, 5)], 10).blackjack)
+        self.assertFalse(Hand([Card(0, 9), Card(1, 13)], 10).blackjack)
+
     def test_multiple_aces(self):
         # Multiple aces should be counted correctly (A, A, 9 == 21)
         h = Hand([Card(0, 1), Card(1, 1), Card(2, 9)], 5)
@@ -30,48 +41,134 @@ class TestDeckAndHand(unittest.TestCase):
         h = Hand([Card(0, 10), Card(0, 9), Card(0, 5)], 5)
         self.assertTrue(h.bust)
 
+    def test_score_many_matches_hand(self):
+        rows = [[1, 9, 0], [1, 1, 9], [10, 9, 5]]
+        expected = [Hand([Card(0, n) for n in r if n], 5).score for r in rows]
+        self.assertEqual(Hand.score_many(rows), expected)
+
+    def test_incremental_score_add_and_pop(self):
+        # running totals must match a full recount as cards come and go
+        h = Hand([Card(0, 1)], 5)
+        h.addToHand([Card(1, 13)])
+        self.assertEqual(h.score, 21)
+        self.assertTrue(h.blackjack)
+        h.addToHand([Card(2, 5)])
+        self.assertEqual(h.score, 16)
+        self.assertFalse(h.blackjack)
+        self.assertEqual(h.popFromHand().number, 5)
+        self.assertEqual(h.score, 21)
+        h.addCard(Card(3, 1))
+        self.assertEqual(h.score, 12)
+        self.assertEqual(len(h.cards), 3)
+
+    def test_update_score_after_replacing_cards(self):
+        h = Hand([Card(0, 10), Card(0, 9), Card(0, 5)], 5)
+        h.cards = []
+        h.updateScore()
+        self.assertEqual(h.score, 0)
+        self.assertFalse(h.bust)
+
     # Deck-specific tests moved to tests/test_cards.py
 
 
 class TestGame(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # one game shared by the dealer scenarios below
+        cls.game = Game(1, 1000, config.DEFAULT_MINIMUM_BUY, [], num_decks=1, test_mode=True)
+
     def test_game_num_decks_forwarded(self):
         # Ensure the Game constructor forwards num_decks to Deck
         g = Game(1, 1000, config.DEFAULT_MINIMUM_BUY, [], num_decks=3, test_mode=True)
         self.assertEqual(len(g.deck.deck), 52 * 3)
 
     def test_dealer_hits_until_threshold(self):
-        # Dealer with 10+6 (16) should draw until reaching or exceeding the stand threshold
+        # Dealer starting on 16 should draw until reaching or exceeding the
+        # stand threshold, whether driven by hand or by Game.play_dealer()
+        def hit_loop(g):
+            # Run dealer draw loop (same logic used in Game.play_dealer)
+            while g.dealer.score < config.DEALER_STAND_THRESHOLD:
+                g.hit(-1)
+
+        scenarios = [
+            # 10 and 6 with a 2 on top of the deck, so the dealer reaches 18
+            ("hit loop", [Card(0, 10), Card(0, 6)], [Card(0, 3), Card(0, 2)], hit_loop),
+            # 9 and 7 with a single 2 left, drawn by play_dealer()
+            ("play_dealer", [Card(0, 9), Card(0, 7)], [Card(0, 2)], Game.play_dealer),
+        ]
+        g = self.game
+        for name, dealer_cards, deck_cards, run in scenarios:
+            with self.subTest(scenario=name):
+                # only the dealer and the deck are rebuilt between scenarios
+                g.dealer = Hand(dealer_cards, 0, isDealer=True)
+                g.deck.deck = deck_cards
+                initial_deck_len = len(g.deck.deck)
+
+                run(g)
+
+                # Dealer should have drawn the 2 and now have score >= threshold
+                self.assertGreaterEqual(g.dealer.score, config.DEALER_STAND_THRESHOLD)
+                self.assertTrue(any(c.number == 2 for c in g.dealer.cards))
+                self.assertEqual(len(g.deck.deck), initial_deck_len - 1)
+
+    def test_deal_order(self):
+        # dealer is dealt first, then the cards go round the hands twice
+        g = Game(2, 1000, config.DEFAULT_MINIMUM_BUY, [], num_decks=1, test_mode=True)
+        g.deck.deck = [Card(0, n) for n in (9, 8, 7, 6, 5, 4)]
+        g.deal()
+        self.assertEqual([c.number for c in g.dealer.cards], [4, 5])
+        self.assertEqual([c.number for c in g.hands[0].cards], [6, 8])
+        self.assertEqual([c.number for c in g.hands[1].cards], [7, 9])
+        self.assertEqual(len(g.deck.deck), 0)
+
+    def test_deal_redraws_dealer_natural(self):
         g = Game(1, 1000, config.DEFAULT_MINIMUM_BUY, [], num_decks=1, test_mode=True)
-        # set dealer to 10 and 6 => score 16
-        g.dealer = Hand([Card(0, 10), Card(0, 6)], 0, isDealer=True)
-        # arrange the deck so the next card to be popped is a 2 (so dealer will reach 18)
-        g.deck.deck = [Card(0, 3), Card(0, 2)]
-        initial_deck_len = len(g.deck.deck)
-
-        # Run dealer draw loop (same logic used in Game.begin_game)
-        while g.dealer.score < config.DEALER_STAND_THRESHOLD:
-            g.hit(-1)
-
-        # Dealer should have drawn the 2 and now have score >= threshold
-        self.assertGreaterEqual(g.dealer.score, config.DEALER_STAND_THRESHOLD)
-        self.assertTrue(any(c.number == 2 for c in g.dealer.cards))
-        self.assertEqual(len(g.deck.deck), initial_deck_len - 1)
-
-    def test_play_dealer_method(self):
-        # Directly call Game.play_dealer() to ensure the method draws until threshold
+        # the top two cards give the dealer A + K
+        g.deck.deck = [Card(0, n) for n in (2, 3, 4, 5, 13, 1)]
+        g.deal()
+        self.assertNotEqual(g.dealer.score, 21)
+        self.assertEqual(len(g.dealer.cards), 2)
+        self.assertEqual(len(g.hands[0].cards), 2)
+        self.assertEqual(len(g.deck.deck), 2)
+
+    def test_test_mode_never_sleeps(self):
         g = Game(1, 1000, config.DEFAULT_MINIMUM_BUY, [], num_decks=1, test_mode=True)
-        g.dealer = Hand([Card(0, 9), Card(0, 7)], 0, isDealer=True)  # 16
-        # Put a single card (2) at the end so pop() will draw it
-        g.deck.deck = [Card(0, 2)]
-        initial_len = len(g.deck.deck)
-
-        # run the dealer method (sleeps are short; we can patch time.sleep if needed)
+        g.dealer = Hand([Card(0, 2), Card(0, 3)], 0, isDealer=True)
+        # the game must not rely on the module-wide flag, so turn it off
+        # (silencing print, which it also gated) while the dealer plays
+        with mock.patch.object(blackjack, "TEST_MODE", False), \
+                mock.patch("builtins.print"), \
+                mock.patch("time.sleep") as fake_sleep:
+            g.play_dealer()
+        fake_sleep.assert_not_called()
+
+    def test_play_dealer_settles_bankroll(self):
+        g = Game(3, 1000, 10, [], num_decks=1, test_mode=True)
+        g.dealer = Hand([Card(0, 10), Card(0, 8)], 0, isDealer=True)  # 18, stands
+        g.hands = [
+            Hand([Card(0, 1), Card(1, 13)], 10),  # blackjack: 2.5x back
+            Hand([Card(0, 10), Card(1, 8)], 10),  # push: bet back
+            Hand([Card(0, 10), Card(1, 7)], 10),  # loses
+        ]
+        money = g.total_money
         g.play_dealer()
-
-        # Dealer should have drawn the 2 and reached at least the threshold
-        self.assertTrue(any(c.number == 2 for c in g.dealer.cards))
-        self.assertGreaterEqual(g.dealer.score, config.DEALER_STAND_THRESHOLD)
-        self.assertEqual(len(g.deck.deck), initial_len - 1)
+        self.assertEqual([h.status for h in g.hands], [1, 0, -1])
+        self.assertEqual(g.total_money, money + 25 + 10)
+
+    def test_simulate_leaves_game_untouched(self):
+        g = Game(1, 1000, config.DEFAULT_MINIMUM_BUY, [], num_decks=2, test_mode=True)
+        money = g.total_money
+        ev = g.simulate(100, seed=1)
+        self.assertEqual(ev, g.simulate(100, seed=1))
+        self.assertEqual(g.total_money, money)
+        self.assertEqual(len(g.deck.deck), 52 * 2)
+
+
+class TestWaitForInput(unittest.TestCase):
+    def test_reprompts_until_valid(self):
+        with mock.patch("builtins.input", side_effect=["9", "x", "2"]) as fake:
+            self.assertEqual(waitForInput("? ", ["1", "2"]), "2")
+        self.assertEqual(fake.call_count, 3)
 
 
     if __name__ == "__main__":
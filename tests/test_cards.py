@@ -5,6 +5,10 @@ card/deck primitives so higher-level game logic can rely on well-defined
 behaviour.
 """
 
+import copy
+from collections import Counter
+import pickle
+import random
 import unittest
 
 from cards import Card, Deck
@@ -28,6 +32,25 @@ class TestCard(unittest.TestCase):
         with self.assertRaises(IndexError):
             _ = str(c)
 
+    def test_equality_and_hash_use_packed_code(self):
+        self.assertEqual(Card(2, 11).code, 2 << 4 | 11)
+        self.assertEqual(Card(2, 11), Card(2, 11))
+        self.assertNotEqual(Card(2, 11), Card(1, 11))
+        self.assertEqual(len({Card(0, 1), Card(0, 1), Card(3, 1)}), 2)
+        self.assertEqual(sorted([Card(1, 2), Card(0, 13), Card(0, 1)]), [Card(0, 1), Card(0, 13), Card(1, 2)])
+
+    def test_cards_are_interned_and_immutable(self):
+        self.assertIs(Card(1, 12), Card(1, 12))
+        self.assertIs(copy.copy(Card(1, 12)), Card(1, 12))
+        self.assertIs(pickle.loads(pickle.dumps(Card(1, 12))), Card(1, 12))
+        with self.assertRaises(AttributeError):
+            Card(1, 12).number = 5
+
+    def test_card_has_no_instance_dict(self):
+        # Cards are slotted so large shoes stay compact
+        c = Card(0, 1)
+        self.assertFalse(hasattr(c, "__dict__"))
+
 
 class TestDeck(unittest.TestCase):
     def test_num_decks_must_be_positive(self):
@@ -37,6 +60,7 @@ class TestDeck(unittest.TestCase):
     def test_deck_counts_and_order(self):
         d = Deck(1)
         self.assertEqual(len(d.deck), 52)
+        self.assertEqual(len(d), 52)
 
         # draw(0) should return an empty list and not modify the deck
         before = len(d.deck)
@@ -48,6 +72,7 @@ class TestDeck(unittest.TestCase):
         all_cards = d.draw(len(d.deck))
         self.assertEqual(len(all_cards), 52)
         self.assertEqual(len(d.deck), 0)
+        self.assertEqual(len(d), 0)
 
     def test_draw_more_than_available_raises(self):
         d = Deck(1)
@@ -56,6 +81,28 @@ class TestDeck(unittest.TestCase):
         with self.assertRaises(IndexError):
             d.draw(1)
 
+    def test_failed_draw_leaves_deck_intact(self):
+        d = Deck(1)
+        d.deck = [Card(0, 3), Card(0, 2)]
+        with self.assertRaises(IndexError):
+            d.draw(3)
+        self.assertEqual(d.deck, [Card(0, 3), Card(0, 2)])
+        self.assertEqual(d.draw(0), [])
+
+    def test_draw_card_takes_top_card(self):
+        d = Deck(1)
+        d.deck = [Card(0, 3), Card(0, 2)]
+        self.assertEqual(d.drawCard(), Card(0, 2))
+        self.assertEqual(d.drawCard(), Card(0, 3))
+        with self.assertRaises(IndexError):
+            d.drawCard()
+
+    def test_draw_is_last_in_first_out(self):
+        d = Deck(1)
+        d.deck = [Card(0, 3), Card(0, 2), Card(0, 1)]
+        self.assertEqual([c.number for c in d.draw(2)], [1, 2])
+        self.assertEqual([c.number for c in d.deck], [3])
+
     def test_return_to_deck_appends_and_reports_count(self):
         d = Deck(1)
         drawn = d.draw(3)
@@ -64,12 +111,44 @@ class TestDeck(unittest.TestCase):
         self.assertEqual(n, 3)
         self.assertEqual(len(d.deck), 52)
 
+    def test_template_is_not_shared_between_decks(self):
+        a, b = Deck(2), Deck(2)
+        a.draw(5)
+        self.assertEqual(len(b.deck), 104)
+        self.assertEqual(len(Deck(2).deck), 104)
+
+    def test_decks_share_card_instances(self):
+        d = Deck(6)
+        self.assertEqual(len({id(c) for c in d.deck}), 52)
+        self.assertIs(Card.get(0, 1), Card.get(0, 1))
+
     def test_shuffle_preserves_multiset(self):
         d = Deck(2)
         before = [(c.suit, c.number) for c in d.deck]
         d.shuffleDeck()
         after = [(c.suit, c.number) for c in d.deck]
-        self.assertEqual(sorted(before), sorted(after))
+        self.assertEqual(Counter(before), Counter(after))
+
+    def test_seeded_shuffles_are_reproducible(self):
+        a, b = Deck(2, seed=42), Deck(2, seed=42)
+        a.shuffleDeck()
+        b.shuffleDeck()
+        self.assertEqual([str(c) for c in a.deck], [str(c) for c in b.deck])
+
+    def test_class_seed_drives_unseeded_decks(self):
+        a, b = Deck(1), Deck(1)
+        Deck.seed(11)
+        a.shuffleDeck()
+        Deck.seed(11)
+        b.shuffleDeck()
+        self.assertEqual(a.deck, b.deck)
+        Deck.seed()
+
+    def test_shuffle_with_explicit_rng(self):
+        a, b = Deck(1), Deck(1)
+        a.shuffleDeck(random.Random(3))
+        b.shuffleDeck(random.Random(3))
+        self.assertEqual(a.deck, b.deck)
 
 
 if __name__ == "__main__":
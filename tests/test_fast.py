@@ -0,0 +1,123 @@
+"""Unit tests for the optional `_fast` helpers.
+
+These run against whichever implementation is available: the numba
+compiled functions when numba is installed, plain Python otherwise.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+from _fast import HAS_NUMBA, play_round, score_hand_nb, score_hands, score_ranks, simulate
+
+
+def ranks(values):
+    """Return `values` as the compiled helpers expect them.
+
+    Under numba that is a uint8 array (an empty list can't be typed and
+    lists go through the deprecated reflected-list path); the pure-Python
+    fallback takes plain lists.
+    """
+    if HAS_NUMBA:
+        import numpy as np
+
+        return np.array(values, dtype=np.uint8)
+    return list(values)
+
+
+class TestScoreRanks(unittest.TestCase):
+    def test_matches_hand_rules(self):
+        self.assertEqual(score_ranks(ranks([1, 9]), 2), 20)
+        self.assertEqual(score_ranks(ranks([1, 13]), 2), 21)
+        self.assertEqual(score_ranks(ranks([1, 1, 9]), 3), 21)
+        self.assertEqual(score_ranks(ranks([10, 9, 5]), 3), 24)
+
+    def test_only_first_n_ranks_are_scored(self):
+        # trailing slots of a preallocated buffer must be ignored
+        self.assertEqual(score_ranks(ranks([10, 6, 13, 13]), 2), 16)
+        self.assertEqual(score_ranks(ranks([]), 0), 0)
+
+
+class TestScoreHands(unittest.TestCase):
+    def test_single_hand_flags(self):
+        self.assertEqual(score_hand_nb(ranks([1, 1, 9])), (21, False, False))
+        self.assertEqual(score_hand_nb(ranks([1, 13, 0, 0])), (21, True, False))
+        self.assertEqual(score_hand_nb(ranks([10, 9, 5])), (24, False, True))
+
+    def test_rows_are_scored_independently(self):
+        rows = [[1, 9, 0], [1, 1, 9], [10, 9, 5]]
+        self.assertEqual(score_hands(rows), [20, 21, 24])
+
+    @unittest.skipUnless(HAS_NUMBA, "numba not installed")
+    def test_compiled_on_uint8_array(self):
+        import numpy as np
+
+        self.assertEqual(score_hand_nb(np.array([1, 1, 9], np.uint8))[0], 21)
+
+
+class TestSimulate(unittest.TestCase):
+    SHOE = [n for _ in range(4) for n in range(1, 14)]
+
+    def test_round_keeps_shoe_a_permutation(self):
+        shoe = ranks(self.SHOE)
+        result, state = play_round(shoe, len(shoe), 12345, 17, 17)
+        self.assertIn(result, (-1.0, 0.0, 1.0, 1.5))
+        self.assertNotEqual(state, 0)
+        self.assertEqual(sorted(int(r) for r in shoe), sorted(self.SHOE))
+
+    def test_seeded_runs_are_reproducible(self):
+        a = simulate(self.SHOE, 200, seed=7)
+        b = simulate(self.SHOE, 200, seed=7)
+        self.assertEqual(a, b)
+        self.assertGreaterEqual(a, -1.0)
+        self.assertLessEqual(a, 1.5)
+
+    def test_rejects_non_positive_round_count(self):
+        with self.assertRaises(ValueError):
+            simulate(self.SHOE, 0)
+
+
+# Runs the CUDA kernel in a fresh interpreter, where NUMBA_ENABLE_CUDASIM
+# can still take effect before numba is imported.
+_CUDASIM_SCRIPT = """
+import numpy as np
+from numba import cuda
+from numba.cuda.random import create_xoroshiro128p_states
+import _fast
+
+n = 64
+shoe = np.array([r for _ in range(4) for r in range(1, 14)], dtype=np.uint8)
+out = cuda.device_array(n, dtype=np.float32)
+_fast._get_cuda_kernel()[1, n](create_xoroshiro128p_states(n, seed=3), cuda.to_device(shoe), 17, 17, out)
+res = out.copy_to_host()
+assert set(res.tolist()) <= {-1.0, 0.0, 1.0, 1.5}, res
+print(len(set(res.tolist())))
+"""
+
+
+@unittest.skipUnless(HAS_NUMBA, "numba not installed")
+class TestCudaKernel(unittest.TestCase):
+    def _launch(self, cudasim):
+        env = dict(os.environ, NUMBA_ENABLE_CUDASIM=cudasim)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+        proc = subprocess.run(
+            [sys.executable, "-c", _CUDASIM_SCRIPT], env=env, cwd=root, capture_output=True, text=True
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        # 64 independently seeded rounds shouldn't all share one outcome
+        self.assertGreater(int(proc.stdout.strip()), 1)
+
+    def test_kernel_under_cuda_simulator(self):
+        self._launch("1")
+
+    def test_kernel_on_gpu(self):
+        from numba import cuda
+
+        if not cuda.is_available():
+            self.skipTest("no CUDA device")
+        self._launch("0")
+
+if __name__ == "__main__":
+    unittest.main()